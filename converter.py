@@ -1,10 +1,51 @@
+import logging
+from itertools import repeat
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# Stands in for the three-space word gap while decoding; literal occurrences in the input are
+# neutralised first, see from_morse_code
+_WORD_BREAK = '\0'
+# Separates the inputs of a batch conversion; it is never a valid character to convert
+_TEXT_BREAK = '\0'
+# Deleted from bytes input before decoding, so non-ASCII bytes never reach the case mapping
+_NON_ASCII_BYTES = bytes(range(128, 256))
+
+
 class MorseCodeConverter:
+    __slots__ = ('morse_code_dict', '_reverse_dict', '_decode_table', '_translate_table', '_batch_translate_table')
+
     def __init__(self, morse_code_dict):
-        self.morse_code_dict = morse_code_dict
+        # Snapshot and freeze the dictionary so the derived tables below stay in sync with it
+        self.morse_code_dict = MappingProxyType(dict(morse_code_dict))
+        self._reverse_dict = MappingProxyType({v: k for k, v in self.morse_code_dict.items()})
+        self._decode_table = {**self._reverse_dict, _WORD_BREAK: ' '}
+
+        # str.translate table indexed by code point: every code carries its trailing separator and
+        # a space in the input adds two more, so words end up three spaces apart in the output.
+        # Only single character keys can match a character of the input, so only those go in the
+        # flat tuple lookup; longer keys such as prosigns are still decoded via the reverse dict.
+        # The input used to be upper-cased before lookup, so a key is reached from itself only if
+        # it is upper case, and from its lower case form if that upper-cases back to the key.
+        table = {}
+        for k, v in self.morse_code_dict.items():
+            if len(k) != 1:
+                continue
+            lower = k.lower()
+            if k.upper() == k:
+                table[ord(k)] = v + ' '
+            if len(lower) == 1 and lower.upper() == k:
+                table[ord(lower)] = v + ' '
+        table[ord(' ')] = '  '
+        self._translate_table = tuple(table.get(i) for i in range(max(table, default=-1) + 1))
+        self._batch_translate_table = (_TEXT_BREAK,) + self._translate_table[1:]
 
     def to_morse_code(self, input_string):
         """
         Converts a string to Morse code, ignoring characters not in the Morse code dictionary.
+        Ignored characters are reported in a single logged warning. Leading and trailing spaces
+        are dropped, so the output never starts or ends with a gap.
 
         Args:
         input_string (str): The string to convert.
@@ -13,30 +54,86 @@ class MorseCodeConverter:
         Returns:
         str: The converted Morse code string.
         """
-        upper_string = input_string.upper()
-        morse_code_list = []
+        return self._translate(input_string, self._translate_table).strip()
 
-        for char in upper_string:
-            if char in self.morse_code_dict:
-                morse_code_list.append(self.morse_code_dict[char])
-            elif char == ' ':
-                morse_code_list.append('   ')  # Three spaces to separate words in Morse code
-            else:
-                # Optionally, you can print a warning or ignore the character
-                print(f"Warning: '{char}' is not a valid Morse code character and will be ignored.")
+    def to_morse_code_many(self, input_strings):
+        """
+        Converts several strings to Morse code at once, paying the per-call overhead only once.
+        Each string is converted exactly as by to_morse_code.
 
-        return ' '.join(morse_code_list)
+        Args:
+        input_strings (iterable of str): The strings to convert.
 
-    def from_morse_code(self, morse_string):
-        # Invert the Morse code dictionary
-        text_dict = {v: k for k, v in self.morse_code_dict.items()}
+        Returns:
+        list: The converted Morse code strings, in input order.
+        """
+        input_strings = list(input_strings)
+        if not input_strings:
+            return []
+
+        joined = _TEXT_BREAK.join(input_strings)
+        if joined.count(_TEXT_BREAK) != len(input_strings) - 1:
+            # An input contains the separator itself, so it cannot be split back apart
+            return [self.to_morse_code(input_string) for input_string in input_strings]
+
+        morse_code = self._translate(joined, self._batch_translate_table)
+        return [code.strip() for code in morse_code.split(_TEXT_BREAK)]
 
-        # Split the Morse code string into words and then characters
-        morse_words = morse_string.split('   ')  # Three spaces to separate words
-        decoded_message = []
+    def _translate(self, input_string, table):
+        size = len(table)
 
-        for word in morse_words:
-            decoded_chars = [text_dict[char] for char in word.split() if char in text_dict]
-            decoded_message.append(''.join(decoded_chars))
+        invalid_chars = [char for char in set(input_string) if ord(char) >= size or table[ord(char)] is None]
+        if invalid_chars:
+            # Characters whose upper case form converts are replaced by it beforehand (e.g. 'ß' ->
+            # 'SS'), as upper-casing the input used to do. Of the rest, unmapped entries in the
+            # table are None and get deleted by translate, but code points past its end would be
+            # copied through unchanged, so those are deleted here too.
+            ignored_chars = []
+            extra_table = {}
+            for char in invalid_chars:
+                upper = char.upper()
+                if all(ord(c) < size and table[ord(c)] is not None for c in upper):
+                    extra_table[ord(char)] = upper
+                else:
+                    ignored_chars.append(char)
+                    if ord(char) >= size:
+                        extra_table[ord(char)] = None
+
+            if ignored_chars:
+                logger.warning("Ignoring characters that are not valid in Morse code: %s",
+                               ', '.join(map(repr, sorted(ignored_chars))))
+            if extra_table:
+                input_string = input_string.translate(extra_table)
+
+        return input_string.translate(table)
+
+    def to_morse_code_bytes(self, input_bytes):
+        """
+        Converts ASCII bytes, e.g. read from a file or socket, to Morse code bytes. A convenience
+        wrapper around to_morse_code: non-ASCII bytes are ignored and reported, as bytes, in a
+        logged warning of their own.
+
+        Args:
+        input_bytes (bytes): The bytes to convert.
+
+        Returns:
+        bytes: The converted Morse code, ASCII encoded.
+        """
+        ascii_bytes = input_bytes.translate(None, _NON_ASCII_BYTES)
+        if len(ascii_bytes) != len(input_bytes):
+            ignored_bytes = sorted(set(input_bytes).difference(ascii_bytes))
+            logger.warning("Ignoring bytes that are not valid in Morse code: %s",
+                           ', '.join(repr(bytes((byte,))) for byte in ignored_bytes))
+
+        return self.to_morse_code(ascii_bytes.decode('ascii')).encode('ascii')
+
+    def from_morse_code(self, morse_string):
+        if _WORD_BREAK in morse_string:
+            # A literal NUL must not read as a word gap. Any other non-Morse, non-whitespace
+            # character keeps its token undecodable, so such tokens are still dropped.
+            morse_string = morse_string.replace(_WORD_BREAK, '#')
 
-        return ' '.join(decoded_message)
+        # Mark word gaps with a token of their own so one split yields every code in order, then
+        # decode them all in a single C-level pass, dropping codes that are not in the dictionary
+        tokens = morse_string.replace('   ', f' {_WORD_BREAK} ').split()
+        return ''.join(map(self._decode_table.get, tokens, repeat('')))
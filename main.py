@@ -2,11 +2,23 @@ from converter import MorseCodeConverter
 from morse_code_player import MorseCodePlayer
 from morse_code_data import international_code  # Import the dictionary
 
+MENU_CHOICES = frozenset(('1', '2', '3', '4'))
+YES_RESPONSES = frozenset(('y', 'yes'))
+NO_RESPONSES = frozenset(('n', 'no'))
+
+MENU = '\n'.join((
+    "\nOptions:",
+    "1. Convert Text to Morse Code and Optionally Play Sound",
+    "2. Convert Morse Code to Text and Optionally Play Sound",
+    "3. Play Morse Code Sound",
+    "4. Exit",
+))
+
 
 def get_user_choice():
     while True:
         choice = input("Choose an option (1-4): ")
-        if choice in ['1', '2', '3', '4']:
+        if choice in MENU_CHOICES:
             return choice
         else:
             print("Invalid option, please choose a number between 1 and 4.")
@@ -15,9 +27,9 @@ def get_user_choice():
 def get_yes_or_no(prompt):
     while True:
         response = input(prompt).lower()
-        if response in ['y', 'yes']:
+        if response in YES_RESPONSES:
             return True
-        elif response in ['n', 'no']:
+        elif response in NO_RESPONSES:
             return False
         else:
             print("Please answer with 'yes' or 'no'.")
@@ -30,11 +42,7 @@ print('Welcome to the International Morse Code Converter and Player')
 
 convert_message = True
 while convert_message:
-    print("\nOptions:")
-    print("1. Convert Text to Morse Code and Optionally Play Sound")
-    print("2. Convert Morse Code to Text and Optionally Play Sound")
-    print("3. Play Morse Code Sound")
-    print("4. Exit")
+    print(MENU)
     choice = get_user_choice()
 
     if choice == '1':
@@ -1,4 +1,6 @@
-international_code = {
+from types import MappingProxyType
+
+international_code = MappingProxyType({
     'A': '.-', 'B': '-...', 'C': '-.-.', 'D': '-..', 'E': '.',
     'F': '..-.', 'G': '--.', 'H': '....', 'I': '..', 'J': '.---',
     'K': '-.-', 'L': '.-..', 'M': '--', 'N': '-.', 'O': '---',
@@ -13,4 +15,4 @@ international_code = {
     '/': '-..-.', '(': '-.--.', ')': '-.--.-', '&': '.-...', ':': '---...',
     ';': '-.-.-.', '=': '-...-', '+': '.-.-.', '-': '-....-', '_': '..--.-',
     '"': '.-..-.', '$': '...-..-', '@': '.--.-.'
-}
\ No newline at end of file
+})
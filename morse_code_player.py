@@ -1,43 +1,111 @@
 import pygame
 import numpy as np
-import time
+
+
+# Every byte other than a dot, dash or space, stripped from messages before they are rendered
+_UNPLAYABLE_BYTES = bytes(b for b in range(256) if b not in b'.- ')
 
 
 class MorseCodePlayer:
+    # The tone and timings are baked into the cached segments, so they are fixed at construction
+    # and exposed read-only; create a new player to change them
     def __init__(self, frequency=600, unit_duration=100):
-        self.frequency = frequency
-        self.dot_length = unit_duration
-        self.dash_length = unit_duration * 3
-        self.pause = unit_duration / 1000
-        self.char_pause = unit_duration * 3 / 1000
-        self.word_pause = unit_duration * 7 / 1000
+        self._frequency = frequency
+        self._dot_length = unit_duration
+        self._dash_length = unit_duration * 3
+        self._pause = unit_duration / 1000
+        self._char_pause = unit_duration * 3 / 1000
+        self._word_pause = unit_duration * 7 / 1000
         pygame.mixer.init(frequency=44100, size=-16, channels=1)
+        # The mixer format is fixed once initialised, so query it a single time
+        self._sample_rate, _, self._channels = pygame.mixer.get_init()
+        pygame.mixer.set_reserved(1)
+        self._channel = pygame.mixer.Channel(0)
+        # Round the unit to whole samples once and derive every element and gap from it, so the
+        # 1/3/7 timing ratios hold exactly whatever the unit duration
+        self._unit_samples = round(unit_duration * self._sample_rate / 1000)
+        self._tone = np.empty(0, dtype=np.int16)
+        self._segments = self._build_segments()
+
+    @property
+    def frequency(self):
+        return self._frequency
+
+    @property
+    def dot_length(self):
+        return self._dot_length
+
+    @property
+    def dash_length(self):
+        return self._dash_length
+
+    @property
+    def pause(self):
+        return self._pause
+
+    @property
+    def char_pause(self):
+        return self._char_pause
+
+    @property
+    def word_pause(self):
+        return self._word_pause
+
+    def _sine_samples(self, total_samples):
+        # Every tone starts at phase zero, so a shorter tone is a prefix of a longer one and only
+        # the longest tone requested so far ever has to be synthesised
+        if total_samples > self._tone.size:
+            # The phase stays float64: in float32 it loses precision as the tone gets longer. This
+            # runs once per cached tone, so the wider type costs nothing on the playback path
+            phase = np.arange(total_samples, dtype=np.float64)
+            phase *= 2 * np.pi * self.frequency / self._sample_rate
+            np.sin(phase, out=phase)
+            phase *= 32767 * 0.5
+            np.rint(phase, out=phase)
+            self._tone = phase.astype(np.int16)
+        return self._tone[:total_samples]
+
+    def _build_segments(self):
+        unit = self._unit_samples
+        element_gap = np.zeros(unit, dtype=np.int16)
+        dash = self._sine_samples(3 * unit)
+        dot = self._sine_samples(unit)
+
+        # Every dot and dash is followed by a one unit gap; each space then tops that up to the
+        # three unit character gap, so the three spaces between words add up to the seven unit gap
+        segments = [None] * 256
+        segments[ord('.')] = np.concatenate((dot, element_gap))
+        segments[ord('-')] = np.concatenate((dash, element_gap))
+        segments[ord(' ')] = np.zeros(2 * unit, dtype=np.int16)
+        return tuple(segments)
+
+    def _make_sound(self, samples):
+        if self._channels == 2:  # For stereo, duplicate the array in a single copy pass
+            samples = np.broadcast_to(samples[:, np.newaxis], (samples.size, 2)).copy()
+
+        return pygame.sndarray.make_sound(samples)
 
     def create_sine_wave(self, duration):
-        sample_rate = pygame.mixer.get_init()[0]
-        channels = pygame.mixer.get_init()[2]
-        total_samples = int(duration * sample_rate)
+        total_samples = int(duration * self._sample_rate)
 
-        wave_samples = (
-                np.sin(2 * np.pi * np.arange(total_samples) * self.frequency / sample_rate) * 32767 * 0.5).astype(
-            np.int16)
+        return self._make_sound(self._sine_samples(total_samples))
 
-        if channels == 2:  # For stereo, duplicate the array
-            wave_samples = np.repeat(wave_samples.reshape(total_samples, 1), 2, axis=1)
+    def render(self, morse_string):
+        # The whole message as one mono int16 buffer, laid out so the mixer keeps the timing
+        segments = self._segments
+        playable = morse_string.encode('ascii', 'ignore').translate(None, _UNPLAYABLE_BYTES)
+        if not playable:
+            return np.empty(0, dtype=np.int16)
 
-        return pygame.sndarray.make_sound(wave_samples)
+        return np.concatenate([segments[byte] for byte in playable])
 
     def play_morse_code(self, morse_string):
-        for char in morse_string:
-            if char == '.':
-                sound = self.create_sine_wave(self.dot_length / 1000.0)
-                sound.play()
-            elif char == '-':
-                sound = self.create_sine_wave(self.dash_length / 1000.0)
-                sound.play()
-            elif char == ' ':
-                time.sleep(self.char_pause)
-            else:
-                time.sleep(self.pause)
-            time.sleep(self.pause)
-        time.sleep(self.word_pause)
+        samples = self.render(morse_string)
+        if not samples.size:
+            return
+
+        # A dedicated channel, so playback never competes for a free one and the wait below
+        # only tracks this message rather than every sound the mixer is playing
+        self._channel.play(self._make_sound(samples))
+        while self._channel.get_busy():
+            pygame.time.wait(10)